@@ -1,15 +1,60 @@
+from __future__ import annotations
+
 import json
 from dataclasses import asdict, dataclass
 from datetime import datetime
-from hashlib import sha256
 from pathlib import Path
+from typing import Any, Callable
+
+from xxhash import xxh3_64_hexdigest
 
 from .accolade import Accolade
 from .entry import Entry
 from .rewards import Rewards
 from .team import Team
-from ..constants import MATCH_LOGS_PATH
-from ..database.queries import DatabaseClient, data_hash_exists, insert_match_hash, update_player_data
+from .. import constants
+from ..database.queries import DatabaseClient, fetch_match_hashes, insert_match_hash, update_player_data
+
+# Bind only the serializer callable, so mypy narrows the fallback branch correctly
+_orjson_dumps: Callable[[Any], bytes] | None
+try:
+    from orjson import dumps as _orjson_dumps
+except ImportError:  # pragma: no cover
+    _orjson_dumps = None
+
+# In-memory cache of match hashes that are already known to be persisted, keyed by database path;
+#   skips a database round trip on every modify event (O(1) membership checks)
+_KNOWN_MATCH_HASHES: dict[Path, set[str]] = {}
+
+# A reusable encoder for the stdlib JSON fallback;
+#   json.dumps constructs a fresh JSONEncoder on every call when options are passed
+_JSON_ENCODER: json.JSONEncoder = json.JSONEncoder(separators=(",", ":"))
+
+
+def _serialize_match(match: Match) -> bytes:
+    """
+    Serializes a Match instance to compact JSON bytes,
+      preferring orjson (a C-backed writer) when it's available.
+    :param match: a Match instance
+    :return: the encoded JSON payload
+    """
+    if _orjson_dumps is not None:
+        return _orjson_dumps(match)
+    # asdict instead of default=vars: the nested dataclasses use __slots__
+    return _JSON_ENCODER.encode(asdict(match)).encode()
+
+
+def _known_match_hashes(database: DatabaseClient) -> set[str]:
+    """
+    Resolves the hash cache for a database, lazily populating it
+      from the data_hashes table on first use.
+    :param database: a DatabaseClient instance
+    :return: the set of known match hashes for the database
+    """
+    known_hashes: set[str] | None = _KNOWN_MATCH_HASHES.get(database.file_path)
+    if known_hashes is None:
+        known_hashes = _KNOWN_MATCH_HASHES.setdefault(database.file_path, fetch_match_hashes(database))
+    return known_hashes
 
 
 @dataclass(frozen=True)
@@ -33,25 +78,23 @@ class Match:
         """
         if time is None:
             time = datetime.now()
-        return MATCH_LOGS_PATH / f"{time.year}-{time.month:02d}-{time.day:02d}" / (
+        return constants.MATCH_LOGS_PATH / f"{time.year}-{time.month:02d}-{time.day:02d}" / (
             "quickplay" if self.is_quickplay else "bounty_hunt") / (
             f"{time.hour:02d}-{time.minute:02d}-{time.second:02d}.json")
 
     def generate_hash(self) -> str:
         """
-        Generates a sha256 hash of the match.
-        Some variables are removed to prevent duplicates.
-        :return: a sha256 hash digest
+        Generates an XXH3-64 hash of the match.
+        Some variables are excluded to prevent duplicates.
+        :return: a 16 character hash digest
         """
-        # Convert the current instance to a dictionary
-        match_data: dict = asdict(self)
-
-        # Remove certain variables to prevent entry spamming
-        del match_data["bloodline_rank"]
-        del match_data["region"]
-        del match_data["secondary_region"]
-
-        return sha256(json.dumps(match_data).encode()).hexdigest()
+        # Build a canonical tuple of the hashed fields
+        #   (bloodline_rank and the regions are excluded to prevent entry spamming);
+        #   repr of the frozen dataclasses is deterministic and
+        #   avoids a full asdict deep copy plus a JSON pass per event
+        canonical_data: tuple = (self.player_name, self.is_hunter_dead, self.is_quickplay,
+                                 self.accolades, self.entries, self.rewards, self.teams)
+        return xxh3_64_hexdigest(repr(canonical_data).encode())
 
     def try_save_to_file(self, database: DatabaseClient) -> bool:
         """
@@ -66,15 +109,18 @@ class Match:
         # Generate the match hash
         match_hash: str = self.generate_hash()
 
-        # Check if the hash already exists in the database to prevent duplicates
-        if data_hash_exists(database, match_hash=match_hash):
+        # Check if the hash already exists to prevent duplicates;
+        #   the cache mirrors the data_hashes table, so no per-event query is needed
+        known_hashes: set[str] = _known_match_hashes(database)
+        if match_hash in known_hashes:
             return True
 
         # Generate the file path
         generated_file_path: Path = self.generate_file_path(time=current_time)
 
-        # Save the hash to the database
+        # Save the hash to the database and the in-memory cache
         insert_match_hash(database, match_hash=match_hash, file_path=generated_file_path)
+        known_hashes.add(match_hash)
 
         # Update the player log
         for player in (player for team in self.teams for player in team.players):
@@ -83,14 +129,14 @@ class Match:
                                deaths=player.killed_me + player.downed_me,
                                is_quickplay=self.is_quickplay)
 
-        # Create the directories
-        directory_path: Path = generated_file_path.parent
-        directory_path.mkdir(parents=True, exist_ok=True)
+        # Create the directories if they don't exist
+        generated_file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Generate the match data as JSON
-        match_data: str = json.dumps(self, indent=2, default=vars)
+        # Generate the match data as JSON (compact separators; pretty-printing
+        #   roughly doubles the output size and the time spent serializing)
+        match_data: bytes = _serialize_match(self)
 
-        # Save the data to a file
-        with open(generated_file_path, mode="w") as file:
+        # Save the data to a file in a single buffered write
+        with open(generated_file_path, mode="wb") as file:
             file.write(match_data)
         return False
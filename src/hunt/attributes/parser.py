@@ -41,20 +41,14 @@ def parse_match(root: XmlElement, steam_name: str) -> Match:
     :return: a Match object
     :raises ParserError: from get_element_value
     """
-    accolades: list[Accolade] = []
-    entries: list[Entry] = []
-
     # Determine the expected number of accolades and entries to iterate
     accolades_count: int = get_element_value(root, "MissionBagNumAccolades", result_type=int)
     entries_count: int = get_element_value(root, "MissionBagNumEntries", result_type=int)
 
-    # Parse and store the accolades
-    for i in range(accolades_count):
-        accolades.append(Accolade.deserialize(root, accolade_id=i))
-
-    # Parse and store the entries
-    for i in range(entries_count):
-        entries.append(Entry.deserialize(root, entry_id=i))
+    # Parse the accolades and entries
+    #   (built directly as tuples to avoid an intermediate list and a full copy)
+    accolades: tuple[Accolade, ...] = tuple(Accolade.deserialize(root, accolade_id=i) for i in range(accolades_count))
+    entries: tuple[Entry, ...] = tuple(Entry.deserialize(root, entry_id=i) for i in range(entries_count))
 
     bloodline_rank: int = get_element_value(root, "Unlocks/UnlockRank", result_type=int)
     hunt_dollar_bonus: int = get_element_value(root, "MissionBagFbeGoldBonus", result_type=int)
@@ -64,11 +58,9 @@ def parse_match(root: XmlElement, steam_name: str) -> Match:
     region: str = get_element_value(root, "Region")
     secondary_region: str = get_element_value(root, "SecondaryRegion")
 
-    accolades_tuple: tuple[Accolade, ...] = tuple(accolades)
-    entries_tuple: tuple[Entry, ...] = tuple(entries)
     return Match(steam_name, bloodline_rank, is_hunter_dead, is_quickplay, region, secondary_region,
-                 accolades_tuple, entries_tuple,
-                 _calculate_rewards(accolades_tuple, entries_tuple, hunt_dollar_bonus, hunter_xp_bonus),
+                 accolades, entries,
+                 _calculate_rewards(accolades, entries, hunt_dollar_bonus, hunter_xp_bonus),
                  parse_teams(root=root))
 
 
@@ -81,17 +73,24 @@ def parse_teams(root: XmlElement) -> tuple[Team, ...]:
     """
     teams: list[Team] = []
 
+    # Index the team and player attributes in a single pass over the tree;
+    #   resolving each field through a find call scans every element again.
+    attribute_values: dict[str, str | None] = {
+        name: element.attrib.get("value", None)
+        for element in root.iter("Attr")
+        if (name := element.attrib.get("name", "")).startswith(("MissionBagTeam_", "MissionBagPlayer_"))}
+
     # Determine the expected team count and iterate over the teams
     expected_team_count: int = get_element_value(root, "MissionBagNumTeams", result_type=int)
     for i in range(expected_team_count):
         # Parse each team
-        parsed_team: SerializableTeam = SerializableTeam.deserialize(root, team_id=i)
+        parsed_team: SerializableTeam = SerializableTeam.deserialize(attribute_values, team_id=i)
 
-        players: list[Player] = []
         # Parse each player from the team
-        for j in range(parsed_team.players_count):
-            players.append(Player.deserialize(root, team_id=i, player_id=j))
+        players: tuple[Player, ...] = tuple(
+            Player.deserialize(attribute_values, team_id=i, player_id=j)
+            for j in range(parsed_team.players_count))
 
         teams.append(Team(parsed_team.handicap, parsed_team.is_invite, parsed_team.mmr, parsed_team.own_team,
-                          tuple(players)))
+                          players))
     return tuple(teams)
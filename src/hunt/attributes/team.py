@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import ClassVar
 
 from .player import Player
-from .xml.serializable import MappingGenerator, Serializable, XmlElement
+from .xml.serializable import AttributeValueMap, MappingGenerator, Serializable, XmlElement
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SerializableTeam(Serializable):
     handicap: int
     is_invite: bool
@@ -15,10 +17,20 @@ class SerializableTeam(Serializable):
     own_team: bool
 
     # Serialization
+    _DATA_MAPPINGS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("handicap", "handicap"),
+        ("is_invite", "isinvite"),
+        ("mmr", "mmr"),
+        ("players_count", "numplayers"),
+        ("own_team", "ownteam"))
+
     @staticmethod
+    @lru_cache(maxsize=32)
     def _generate_prefix(team_id: int) -> str:
         """
         Generate a prefix for the class.
+        The result is memoized; the same handful of team ids
+          is formatted twice per team on every parse.
         :param team_id: the id of the team
         :return: a MissionBagEntry prefix
         """
@@ -27,15 +39,10 @@ class SerializableTeam(Serializable):
     @staticmethod
     def _data_mappings() -> MappingGenerator:
         """
-        Yield each variable name and its corresponding attribute suffix.
-        :return: a generator which yields the name, value
+        Return each variable name and its corresponding attribute suffix.
+        :return: a precomputed tuple of name, value pairs
         """
-        # Yield the values
-        yield "handicap", "handicap"
-        yield "is_invite", "isinvite"
-        yield "mmr", "mmr"
-        yield "players_count", "numplayers"
-        yield "own_team", "ownteam"
+        return SerializableTeam._DATA_MAPPINGS
 
     # noinspection PyMethodOverriding
     def serialize(self, root: XmlElement, *, team_id: int) -> None:  # type: ignore[override]
@@ -47,15 +54,17 @@ class SerializableTeam(Serializable):
         # Generate the prefix
         prefix: str = SerializableTeam._generate_prefix(team_id)
 
-        # Serialize the data
-        super().serialize(root, prefix)
+        # Serialize the data (explicit super: slots=True recreates the class,
+        #   which breaks the zero-argument form's __class__ cell)
+        super(SerializableTeam, self).serialize(root, prefix)
 
     # noinspection PyMethodOverriding
     @classmethod
-    def deserialize(cls, root: XmlElement, team_id: int) -> SerializableTeam:  # type: ignore[override]
+    def deserialize(cls, root: XmlElement | AttributeValueMap,  # type: ignore[override]
+                    team_id: int) -> SerializableTeam:
         """
         Deserialize a series of elements into a SerializableTeam instance.
-        :param root: the root element to serialize into
+        :param root: the root element to deserialize from, or a pre-indexed mapping of attribute values
         :param team_id: the id of the team
         :return: a serialized SerializableTeam instance
         """
@@ -66,7 +75,7 @@ class SerializableTeam(Serializable):
         return super(cls, cls).deserialize(root, prefix)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Team:
     handicap: int
     is_invite: bool
@@ -1,10 +1,11 @@
 import builtins
-from typing import TypeAlias, TypeVar
+from typing import Mapping, TypeAlias, TypeVar
 from xml.etree.ElementTree import Element as XmlElement
 
 from ...exceptions import ParserError
 
 ElementValueType: TypeAlias = str | int | bool
+AttributeValueMap: TypeAlias = Mapping[str, str | None]
 _T = TypeVar("_T", bound=ElementValueType)
 
 
@@ -28,10 +29,11 @@ def append_element(parent_element: XmlElement, name: str, value: ElementValueTyp
 
 
 # https://github.com/python/mypy/issues/3737
-def get_element_value(element: XmlElement, name: str, result_type: type[_T] = str) -> _T:  # type: ignore[assignment]
+def get_element_value(element: XmlElement | AttributeValueMap, name: str,
+                      result_type: type[_T] = str) -> _T:  # type: ignore[assignment]
     """
     Resolves an element's "value" attribute based from its name (and suffix).
-    :param element: an XmlElement instance
+    :param element: an XmlElement instance, or a pre-indexed mapping of attribute names to values
     :param name: the element's name
     :param result_type: the type to cast the value to
     :return: the value of an element
@@ -40,20 +42,28 @@ def get_element_value(element: XmlElement, name: str, result_type: type[_T] = st
                          if the result type isn't a supported type
     """
     xpath: str = f"Attr[@name={name!r}]"
-    resolved_element: XmlElement | None = element.find(path=xpath)
-    if resolved_element is not None:
-        value: str | None = resolved_element.attrib.get("value", None)
-        if value is None:
-            raise ParserError(f"""Missing "value" attribute in element {xpath!r}.""")
-
-        match result_type:
-            case builtins.str | builtins.int:
-                try:
-                    return result_type(value)  # type: ignore[return-value]
-                except ValueError:
-                    raise ParserError(f"Couldn't cast the value {value!r} to an {result_type!r} type.")
-            case builtins.bool:
-                return value == "true"  # type: ignore[return-value]
-            case _:
-                raise ParserError("Type conversion not supported.")
-    raise ParserError(f"No such element {xpath!r} in the current element tree.")
+
+    # Resolve the value from a pre-indexed mapping or by scanning the element tree
+    value: str | None
+    if isinstance(element, Mapping):
+        if name not in element:
+            raise ParserError(f"No such element {xpath!r} in the current element tree.")
+        value = element[name]
+    else:
+        resolved_element: XmlElement | None = element.find(path=xpath)
+        if resolved_element is None:
+            raise ParserError(f"No such element {xpath!r} in the current element tree.")
+        value = resolved_element.attrib.get("value", None)
+
+    if value is None:
+        raise ParserError(f"""Missing "value" attribute in element {xpath!r}.""")
+
+    match result_type:
+        case builtins.str | builtins.int:
+            try:
+                return result_type(value)  # type: ignore[return-value]
+            except ValueError:
+                raise ParserError(f"Couldn't cast the value {value!r} to an {result_type!r} type.")
+        case builtins.bool:
+            return value == "true"  # type: ignore[return-value]
+    raise ParserError("Type conversion not supported.")
@@ -1,11 +1,13 @@
 from abc import ABC, abstractmethod
 from dataclasses import is_dataclass
-from typing import Generator, TypeAlias, TypeVar, get_type_hints
+from typing import Iterable, TypeAlias, TypeVar, get_type_hints
 
-from .elements import ElementValueType, XmlElement, append_element, get_element_value
+from .elements import AttributeValueMap, ElementValueType, XmlElement, append_element, get_element_value
 
 _T = TypeVar("_T", bound="Serializable")
-MappingGenerator: TypeAlias = Generator[tuple[str, str], None, None]
+# Any iterable of name pairs is accepted, so implementations may
+#   return a precomputed tuple instead of rebuilding a generator per call
+MappingGenerator: TypeAlias = Iterable[tuple[str, str]]
 
 
 class Serializable(ABC):
@@ -33,10 +35,10 @@ class Serializable(ABC):
 
     @classmethod
     @abstractmethod
-    def deserialize(cls: type[_T], root: XmlElement, name_prefix: str) -> _T:
+    def deserialize(cls: type[_T], root: XmlElement | AttributeValueMap, name_prefix: str) -> _T:
         """
         Deserialize a series of elements into the class instance.
-        :param root: the root element to deserialize from
+        :param root: the root element to deserialize from, or a pre-indexed mapping of attribute values
         :param name_prefix: the name prefix to use when resolving elements
         """
         assert is_dataclass(cls), "The class should be a dataclass."
@@ -2,17 +2,18 @@ import logging
 import statistics
 import sys
 import time
-import xml.etree.ElementTree as ElementTree
 from functools import partial
 from pathlib import Path
+from typing import cast
 
 from colorama import Fore, Style, colorama_text
+from lxml import etree
 
+from hunt import constants
 from hunt.attributes.parser import Match, Player, XmlElement, parse_match
 from hunt.cli.arguments.parser import Config, parse_arguments
 from hunt.cli.exit_codes import ExitCode
-from hunt.constants import DATABASE_PATH, DATABASE_TEST_SERVER_PATH, HUNT_SHOWDOWN_APP_ID, \
-    HUNT_SHOWDOWN_TEST_SERVER_APP_ID, MATCH_LOGS_PATH, RESOURCES_PATH, STEAMWORKS_BINARIES_PATH, STEAMWORKS_SDK_PATH
+from hunt.constants import HUNT_SHOWDOWN_APP_ID, HUNT_SHOWDOWN_TEST_SERVER_APP_ID
 from hunt.database.client import Client as DatabaseClient
 from hunt.exceptions import ParserError, SteamworksError, UnsupportedPlatformError
 from hunt.filesystem.watchdog import FileWatchdog
@@ -20,6 +21,11 @@ from hunt.formats import format_mmr
 from hunt.reward_constants import ASSISTS_CATEGORY
 from hunt.steam.api import SteamworksApi, fetch_hunt_attributes_path, try_extract_steamworks_binaries
 
+# A reusable parser instance; lxml (libxml2) parses the attributes file
+#   considerably faster than the pure-Python ElementTree parser.
+#   Blank text nodes are dropped at parse time so the tree walks downstream touch fewer nodes.
+_XML_PARSER: etree.XMLParser = etree.XMLParser(huge_tree=True, recover=False, remove_blank_text=True)
+
 
 def setup_logger(config: Config) -> None:
     """
@@ -77,9 +83,10 @@ def main(config: Config) -> ExitCode:
     :return: an exit code.
     """
     try:
-        RESOURCES_PATH.mkdir(parents=True, exist_ok=True)  # Create the resource directory if it doesn't exist
-        MATCH_LOGS_PATH.mkdir(parents=True, exist_ok=True)  # Create the match logs directory if it doesn't exist
-        STEAMWORKS_BINARIES_PATH.mkdir(parents=True, exist_ok=True)  # Create the bin directory if it doesn't exist
+        # Create the resource, match log and bin directories if they don't exist
+        constants.RESOURCES_PATH.mkdir(parents=True, exist_ok=True)
+        constants.MATCH_LOGS_PATH.mkdir(parents=True, exist_ok=True)
+        constants.STEAMWORKS_BINARIES_PATH.mkdir(parents=True, exist_ok=True)
     except OSError as exception:
         logging.critical("Failed to create create application-critical directories in the current working directory. "
                          "Are write permissions missing?")
@@ -91,7 +98,7 @@ def main(config: Config) -> ExitCode:
         steamworks_api_path: Path = try_extract_steamworks_binaries()
     except SteamworksError as exception:
         logging.critical("Failed to extract the Steamworks binaries, are you missing the Steamworks SDK?")
-        logging.info(f"The Steamworks SDK should be located at: {STEAMWORKS_SDK_PATH!r}")
+        logging.info(f"The Steamworks SDK should be located at: {constants.STEAMWORKS_SDK_PATH!r}")
         logging.debug(f"Steamworks error: {exception=}")
         return ExitCode.STEAMWORKS_ERROR
     except UnsupportedPlatformError as exception:
@@ -115,7 +122,7 @@ def main(config: Config) -> ExitCode:
     assert attributes_path.exists(), "Attributes file does not exist."
 
     database: DatabaseClient
-    database_path: Path = DATABASE_PATH if not config.test_server else DATABASE_TEST_SERVER_PATH
+    database_path: Path = constants.DATABASE_PATH if not config.test_server else constants.DATABASE_TEST_SERVER_PATH
     with DatabaseClient(file_path=database_path) as database:
         # Set up a file watcher to listen for changes on the attributes file
         file_watchdog: FileWatchdog = FileWatchdog(
@@ -153,8 +160,14 @@ def attributes_file_modified(file_path: Path,
     :param steamworks_api: a SteamworksApi instance
     :param config: the configuration provided by the user
     """
-    # Read the file contents
-    file_contents: bytes = file_path.read_bytes()
+    # Read the file contents in a single call, so the parser
+    #   works on one contiguous in-memory buffer
+    try:
+        file_contents: bytes = file_path.read_bytes()
+    except OSError as exception:
+        # The game may still be holding or replacing the file; skip the update
+        logging.debug(f"Failed to read the attributes file: {exception=}")
+        return
 
     # If the file contents are empty, skip parsing
     if not file_contents:
@@ -162,16 +175,18 @@ def attributes_file_modified(file_path: Path,
 
     try:
         # Attempt to parse the attributes file
-        parsed_attributes: XmlElement = ElementTree.fromstring(file_contents)
-    except ElementTree.ParseError as exception:
+        parsed_attributes: etree._Element = etree.fromstring(file_contents, parser=_XML_PARSER)
+    except etree.XMLSyntaxError as exception:
         # Skip the update
         logging.error("Failed to parse the attributes file.")
         logging.debug(f"Failed to parse the attributes file: {exception=}")
         return
 
-    # Parse the teams from the attributes file
+    # Parse the teams from the attributes file;
+    #   lxml elements implement the subset of the ElementTree API the parser relies on
     try:
-        match: Match = parse_match(root=parsed_attributes, steam_name=steamworks_api.get_persona_name())
+        match: Match = parse_match(root=cast(XmlElement, parsed_attributes),
+                                   steam_name=steamworks_api.get_persona_name())
     except SteamworksError as exception:
         logging.debug(f"Failed to get the user's display name: {exception=}")
         return
@@ -201,10 +216,19 @@ def log_match_data(match: Match, log_statistical_data: bool) -> None:
     def _log_stats() -> None:
         logging.info("Statistics:")
 
-        # Player statistics
-        players: tuple[Player, ...] = tuple(player for team in match.teams for player in team.players)
-        kills: int = sum(player.downed_by_me + player.killed_by_me for player in players if not player.is_partner)
-        deaths: int = sum(player.downed_me + player.killed_me for player in players if not player.is_partner)
+        # Player statistics (collected in a single pass over the teams)
+        player_count: int = 0
+        kills: int = 0
+        deaths: int = 0
+        mmr_data_set: list[int] = []
+        player: Player
+        for team in match.teams:
+            for player in team.players:
+                player_count += 1
+                mmr_data_set.append(player.mmr)
+                if not player.is_partner:
+                    kills += player.downed_by_me + player.killed_by_me
+                    deaths += player.downed_me + player.killed_me
         assists: int = sum(entry.amount for entry in match.entries if entry.category == ASSISTS_CATEGORY)
 
         # Avoid ZeroDivisionError
@@ -212,7 +236,7 @@ def log_match_data(match: Match, log_statistical_data: bool) -> None:
             deaths += 1
 
         logging.info(f"  Bloodline rank: {match.bloodline_rank}")
-        logging.info(f"  Amount of players: {len(players)}")
+        logging.info(f"  Amount of players: {player_count}")
 
         kd_ratio: float = kills / deaths
         kda_ratio: float = (kills + assists) / deaths
@@ -220,7 +244,6 @@ def log_match_data(match: Match, log_statistical_data: bool) -> None:
             logging.info(f"  KD: {kd_ratio:.2f}, KDA: {kda_ratio:.2f}")
 
         # Match statistics
-        mmr_data_set: tuple[int, ...] = tuple(player.mmr for player in players)
         logging.info(f"  MMR: average: {format_mmr(int(statistics.mean(mmr_data_set)))} ± "
                      f"{int(statistics.pstdev(mmr_data_set))}, "
                      f"lowest: {format_mmr(min(mmr_data_set))}, "
@@ -266,21 +289,29 @@ def log_match_data(match: Match, log_statistical_data: bool) -> None:
 
     # Log players
     def _log_players() -> None:
-        # Log information about the local team
-        logging.info("Team:")
-        for player in (player for team in match.teams for player in team.players if team.own_team):
-            logging.info(f"  {player.format_name(is_local_player=player.name == match.player_name)}")
-
-        # Log information about the players the local player interacted with
-        players: tuple[Player, ...] = tuple(player for team in match.teams for player in team.players)
-        if any(player.downed_by_me or player.downed_me or player.killed_by_me or player.killed_me
-               for player in players if not player.is_partner):
-            logging.info("Enemies:")
-            for player in players:
+        # Collect the team and enemy lines in a single pass over the teams
+        team_lines: list[str] = []
+        enemy_lines: list[str] = []
+        has_enemy_interactions: bool = False
+        player: Player
+        for team in match.teams:
+            for player in team.players:
+                if team.own_team:
+                    team_lines.append(f"  {player.format_name(is_local_player=player.name == match.player_name)}")
+                if not player.is_partner and (player.downed_by_me or player.downed_me
+                                              or player.killed_by_me or player.killed_me):
+                    has_enemy_interactions = True
                 if player.downed_by_me or player.killed_by_me:
-                    logging.info(f"  {player.format_kills()}")
+                    enemy_lines.append(f"  {player.format_kills()}")
                 if player.downed_me or player.killed_me:
-                    logging.info(f"  {player.format_deaths()}")
+                    enemy_lines.append(f"  {player.format_deaths()}")
+
+        # Log information about the local team as a single record
+        logging.info("\n".join(("Team:", *team_lines)))
+
+        # Log information about the players the local player interacted with
+        if has_enemy_interactions:
+            logging.info("\n".join(("Enemies:", *enemy_lines)))
 
     _log_players()
 
@@ -1,24 +1,55 @@
+from functools import cache
 from pathlib import Path
 
 HUNT_SHOWDOWN_APP_ID: int = 594650  # Hunt: Showdown App ID
 HUNT_SHOWDOWN_TEST_SERVER_APP_ID: int = 770720  # Hunt: Showdown (Test Server) App ID
 
-# The path (directory) to where match logs are stored
-WORKING_DIRECTORY: Path = Path.cwd()
-RESOURCES_PATH: Path = WORKING_DIRECTORY / "resources"
-MATCH_LOGS_PATH: Path = RESOURCES_PATH / "logs"
-
-# Steam
-STEAMWORKS_BINARIES_PATH: Path = RESOURCES_PATH / "steam"
-STEAMWORKS_SDK_PATH: Path = STEAMWORKS_BINARIES_PATH / "steamworks_sdk.zip"
-
 # Formatting
 STAR_SYMBOL: str = "★"
 MMR_RANGES: tuple[int, ...] = (0, 2000, 2300, 2600, 2750, 3001)
 
-# Database
-DATABASE_PATH: Path = RESOURCES_PATH / "match_data.db"
-DATABASE_TEST_SERVER_PATH: Path = RESOURCES_PATH / "match_data_ts.db"
+
+@cache
+def _working_directory() -> Path:
+    """
+    Resolve the working directory once, on first use.
+    :return: the current working directory
+    """
+    return Path.cwd()
+
+
+# The path constants are resolved lazily (PEP 562) so importing the package
+#   doesn't issue any filesystem syscalls; each value is stored back into the
+#   module namespace on first access, so repeat accesses are plain lookups.
+def __getattr__(name: str) -> Path:
+    """
+    Lazily resolve a path constant and memoize it in the module namespace.
+    :param name: the name of the constant
+    :return: the resolved path
+    :raises AttributeError: if the name isn't a known path constant
+    """
+    resources_path: Path = _working_directory() / "resources"
+    path: Path
+    match name:
+        case "WORKING_DIRECTORY":
+            path = _working_directory()
+        case "RESOURCES_PATH":
+            path = resources_path
+        case "MATCH_LOGS_PATH":  # the path (directory) to where match logs are stored
+            path = resources_path / "logs"
+        case "STEAMWORKS_BINARIES_PATH":
+            path = resources_path / "steam"
+        case "STEAMWORKS_SDK_PATH":
+            path = resources_path / "steam" / "steamworks_sdk.zip"
+        case "DATABASE_PATH":
+            path = resources_path / "match_data.db"
+        case "DATABASE_TEST_SERVER_PATH":
+            path = resources_path / "match_data_ts.db"
+        case _:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = path
+    return path
 
 
 # Helper function to generate create table queries
@@ -17,6 +17,18 @@ def data_hash_exists(database: DatabaseClient, match_hash: str) -> bool:
         return cursor.execute(query, (match_hash,)).fetchone()[0] >= 1
 
 
+def fetch_match_hashes(database: DatabaseClient) -> set[str]:
+    """
+    Fetches every match hash stored in the database.
+    :param database: a DatabaseClient instance
+    :return: a set of all known match hashes
+    """
+    cursor: Cursor
+    with closing(database.cursor()) as cursor:
+        query: str = "SELECT hash FROM data_hashes"
+        return {row[0] for row in cursor.execute(query).fetchall()}
+
+
 def insert_match_hash(database: DatabaseClient, match_hash: str, file_path: Path) -> None:
     """
     Saves a match hash to the database.
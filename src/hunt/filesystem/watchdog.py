@@ -1,14 +1,36 @@
+import threading
 from pathlib import Path
 from typing import Callable
 
 from watchdog.events import FileModifiedEvent, FileSystemEvent, FileSystemEventHandler
-from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
+
+# The interval between filesystem snapshots; the native observers
+#   (e.g. ReadDirectoryChangesW) heavily over-report modify events during
+#   the game's multi-write rewrite sequence, whereas polling at a coarse
+#   granularity emits at most one event per interval.
+_POLLING_INTERVAL_SECONDS: float = 0.25
+
+# The quiescent interval to wait for before invoking the callback;
+#   the game rewrites the attributes file in bursts, so coalescing the
+#   events avoids parsing partially-written snapshots.
+#   Must exceed the polling interval, otherwise the timer always fires
+#   before the next snapshot and never coalesces anything.
+_DEBOUNCE_INTERVAL_SECONDS: float = 0.5
+
+# The maximum amount of cached path-match decisions before the cache is reset;
+#   keeps the cache bounded if the watched directory churns through file names.
+_MATCH_CACHE_LIMIT: int = 256
 
 
 class FileWatchdog(FileSystemEventHandler):
     file_path: Path
     callback: Callable[..., None]
-    _observer: Observer   # type: ignore[valid-type]
+    _observer: PollingObserver
+    _pending_timer: threading.Timer | None
+    _timer_lock: threading.Lock
+    _callback_lock: threading.Lock
+    _match_cache: dict[str, bool]
 
     def __init__(self, file_path: Path, callback: Callable[..., None]):
         """
@@ -19,26 +41,66 @@ class FileWatchdog(FileSystemEventHandler):
         self.file_path = file_path
         self.callback = callback
 
-        self._observer = Observer()
-        self._observer.schedule(event_handler=self, path=file_path.parent)   # type: ignore[no-untyped-call]
+        self._observer = PollingObserver(timeout=_POLLING_INTERVAL_SECONDS)  # type: ignore[no-untyped-call]
+        self._observer.schedule(event_handler=self, path=file_path.parent)  # type: ignore[no-untyped-call]
+
+        self._pending_timer = None
+        self._timer_lock = threading.Lock()
+        self._callback_lock = threading.Lock()
+        self._match_cache = {}
 
     def start(self) -> None:
         """Start the observer."""
-        self._observer.start()  # type: ignore[attr-defined]
+        self._observer.start()  # type: ignore[no-untyped-call]
 
     def join(self) -> None:
         """Wait until the observer thread terminates."""
-        self._observer.join()  # type: ignore[attr-defined]
+        self._observer.join()
 
     def stop(self) -> None:
-        """Stop the observer."""
-        self._observer.stop()  # type: ignore[attr-defined]
+        """Stop the observer and cancel any pending callback."""
+        with self._timer_lock:
+            if self._pending_timer is not None:
+                self._pending_timer.cancel()
+                self._pending_timer = None
+        self._observer.stop()  # type: ignore[no-untyped-call]
 
     def on_modified(self, event: FileSystemEvent) -> None:
         """
         Invoked when a modified event is generated.
+        Bursts of events are debounced; the callback only fires once
+          the file has been quiescent for the debounce interval.
         :param event: a watchdog event
         """
-        if not isinstance(event, FileModifiedEvent) or Path(event.src_path) != self.file_path:
+        if not isinstance(event, FileModifiedEvent):
+            return
+
+        # Resolve whether the event path matches the watched file; the decision is
+        #   cached per raw source path to avoid a Path construction and comparison
+        #   for every event the observer emits for the directory
+        source_path: str = event.src_path
+        is_match: bool | None = self._match_cache.get(source_path)
+        if is_match is None:
+            if len(self._match_cache) >= _MATCH_CACHE_LIMIT:
+                self._match_cache.clear()
+            is_match = self._match_cache.setdefault(source_path, Path(source_path) == self.file_path)
+        if not is_match:
             return
-        self.callback(self.file_path)
+
+        # Restart the debounce timer
+        with self._timer_lock:
+            if self._pending_timer is not None:
+                self._pending_timer.cancel()
+            self._pending_timer = threading.Timer(_DEBOUNCE_INTERVAL_SECONDS, self._invoke_callback)
+            self._pending_timer.daemon = True
+            self._pending_timer.start()
+
+    def _invoke_callback(self) -> None:
+        """
+        Invoke the callback while holding the callback lock.
+        Each debounce timer runs on its own thread, and a callback that
+          outlasts the debounce interval could otherwise overlap with the
+          next one; the lock serializes them.
+        """
+        with self._callback_lock:
+            self.callback(self.file_path)
@@ -1,3 +1,5 @@
+from bisect import bisect_right
+
 from colorama import Fore, Style
 
 from .constants import MMR_RANGES, STAR_SYMBOL
@@ -9,5 +11,6 @@ def format_mmr(mmr: int) -> str:
     :param mmr: an MMR score
     :return: a color-formatted string
     """
-    stars: int = len(MMR_RANGES) - len([mmr_range for mmr_range in MMR_RANGES if mmr < mmr_range])
+    # MMR_RANGES is sorted, so the star count is just the insertion point
+    stars: int = bisect_right(MMR_RANGES, mmr)
     return f"{Fore.BLUE}{mmr}{Style.RESET_ALL} {Fore.LIGHTYELLOW_EX}{STAR_SYMBOL * stars}{Style.RESET_ALL}"
@@ -8,7 +8,7 @@ from pathlib import Path
 from zipfile import ZipFile
 
 from .type_aliases import AppId_t, char, char_pointer, uint32, void_pointer
-from ..constants import STEAMWORKS_BINARIES_PATH, STEAMWORKS_SDK_PATH
+from .. import constants
 from ..exceptions import SteamworksError, UnsupportedPlatformError
 
 
@@ -158,7 +158,7 @@ def generate_api_binary_path() -> Path:
             file_name = f"libsteam_api{bits}.dylib"
         case _:
             raise UnsupportedPlatformError(f"Unsupported platform: {sys.platform}")
-    return STEAMWORKS_BINARIES_PATH / file_name
+    return constants.STEAMWORKS_BINARIES_PATH / file_name
 
 
 def try_extract_steamworks_binaries() -> Path:
@@ -173,11 +173,11 @@ def try_extract_steamworks_binaries() -> Path:
     if expected_api_binary_path.exists():
         return expected_api_binary_path
 
-    if not STEAMWORKS_SDK_PATH.exists():
+    if not constants.STEAMWORKS_SDK_PATH.exists():
         raise SteamworksError("Missing the Steamworks SDK.")
 
     # Extract the correct binary to the disk
-    with ZipFile(file=STEAMWORKS_SDK_PATH) as zip_file:
+    with ZipFile(file=constants.STEAMWORKS_SDK_PATH) as zip_file:
         # Generate the binary file path
         file_name: str
         match (sys.platform, ctypes.sizeof(void_pointer) * 8):
@@ -1,7 +1,6 @@
-import json
 from pathlib import Path
 
-from hunt.attributes.match import DatabaseClient, Match
+from hunt.attributes.match import DatabaseClient, Match, _serialize_match
 from .conftest import MAGIC_FILE_PATH, MagicMock, datetime
 
 
@@ -29,8 +28,8 @@ def test_match_try_save_to_file(io_safe_match: Match, database_client: DatabaseC
     assert io_safe_match.try_save_to_file(database=database_client)  # hash already exists
 
     # Assertions
-    match_data: str = json.dumps(io_safe_match, indent=2, default=vars)
-    mock_open.assert_called_once_with(MAGIC_FILE_PATH, mode="w")  # assert open(MAGIC_FILE_PATH, mode="w") invoked
+    match_data: bytes = _serialize_match(io_safe_match)
+    mock_open.assert_called_once_with(MAGIC_FILE_PATH, mode="wb")  # assert open(MAGIC_FILE_PATH, mode="wb") invoked
 
     mock_open_handle: MagicMock = mock_open()
     mock_open_handle.write.assert_called_once_with(match_data)  # assert file.write(match_data) invoked
@@ -33,6 +33,27 @@ def test_get_element_value(root_element: XmlElement, expected_elements: ElementD
         assert result == expected_value
 
 
+def test_get_element_value_from_mapping(expected_elements: ElementDataCollectionType) -> None:
+    """
+    Test get_element_value by resolving expected elements from a pre-indexed mapping.
+    :param expected_elements: the expected element names and values
+    """
+    # Build the mapping the same way the parser indexes the tree
+    attribute_values: dict[str, str | None] = {
+        element_name: str(expected_value).lower() if isinstance(expected_value, bool) else str(expected_value)
+        for element_name, expected_value in expected_elements}
+
+    # Invoke get_element_value
+    for element_name, expected_value in expected_elements:
+        result = get_element_value(attribute_values, name=element_name,
+                                   result_type=type(expected_value))  # type: ignore
+        assert result == expected_value
+
+    # A missing name should raise the usual parser error
+    with pytest.raises(ParserError, match=r"No such element .* in the current element tree."):
+        get_element_value(attribute_values, name="nonexistent-element-name")
+
+
 def test_get_element_value_missing_value_attribute(root_element: XmlElement) -> None:
     """
     Test get_element_value by passing it an element name that is missing the "value" attribute.
@@ -8,7 +8,7 @@ import pytest
 from _pytest.python_api import RaisesContext
 
 from hunt.database.client import Client as DatabaseClient, Cursor
-from hunt.database.queries import data_hash_exists, insert_match_hash, update_player_data
+from hunt.database.queries import data_hash_exists, fetch_match_hashes, insert_match_hash, update_player_data
 
 # Global variables for data_hashes
 _DUMMY_HASH: str = sha256(b"dummy").hexdigest()
@@ -26,6 +26,17 @@ def test_data_hash_exists(database_client: DatabaseClient, match_hash: str) -> N
     assert data_hash_exists(database_client, match_hash=match_hash)
 
 
+@pytest.mark.order(-1)
+@pytest.mark.parametrize("match_hash", (_DUMMY_HASH,))
+def test_fetch_match_hashes(database_client: DatabaseClient, match_hash: str) -> None:
+    """
+    Test fetch_match_hashes by checking that a known (already inserted) hash value is fetched.
+    :param database_client: a Database instance
+    :param match_hash: the hash of the match
+    """
+    assert match_hash in fetch_match_hashes(database_client)
+
+
 @pytest.mark.parametrize("match_hash, file_path, context", (
         (_DUMMY_HASH, _DUMMY_PATH, does_not_raise()),
         (_DUMMY_HASH, _DUMMY_PATH, pytest.raises(sqlite3.IntegrityError))))